@@ -1,57 +1,123 @@
+import json
 import logging
+import threading
+from typing import TYPE_CHECKING, Optional
 
-import requests
-from garth.exc import GarthHTTPError
-
-from garmin_connect.repository import FileOAuthRepository
-from garmin_connect.service import Garmin
-from garmin_connect.configuration import garmin_connect_configuration
+from garmin_connect.repository import BaseOAuthRepository, FileOAuthRepository
+from garmin_connect.configuration import get_garmin_connect_configuration
 from garmin_connect.exceptions import GarminConnectAuthenticationError
 from garmin_connect.utils import get_mfa
 
+if TYPE_CHECKING:
+    from garmin_connect.service import Garmin
+
 logger = logging.getLogger(__name__)
 
+_cached_api: Optional["Garmin"] = None
+_cached_api_lock = threading.Lock()
+
+
+def _get_stored_oauth(oauth_repo: BaseOAuthRepository):
+    """Return the stored tokens, or None when there are none or they are unreadable."""
+    try:
+        return oauth_repo.get_oauth()
+    except (FileNotFoundError, KeyError, ValueError):
+        return None
+
+
+def init_api() -> Optional["Garmin"]:
+    """
+    Return the process-wide Garmin API client, logging in on first use.
+    Failed logins are not cached, so the next call tries again.
+    """
+    global _cached_api
+
+    with _cached_api_lock:
+        if _cached_api is None:
+            _cached_api = _login()
+
+        return _cached_api
+
 
+def reset_api():
+    """Drop the cached client, e.g. after an authentication failure."""
+    global _cached_api
 
-def init_api():
+    with _cached_api_lock:
+        _cached_api = None
+
+
+def _login() -> Optional["Garmin"]:
     """Initialize Garmin API with your credentials."""
+    # Imported here so that importing this module stays cheap
+    import requests
+    from garth.exc import GarthHTTPError
+
+    from garmin_connect.service import Garmin
 
+    garmin_connect_configuration = get_garmin_connect_configuration()
     oauth_repo = FileOAuthRepository(garmin_connect_configuration.tokenstore)
 
+    # Errors meaning the stored tokens are missing, unreadable or rejected.
+    # Connection errors and timeouts propagate; they are no reason to
+    # discard the stored tokens
+    token_errors = (
+        FileNotFoundError,
+        KeyError,
+        json.JSONDecodeError,
+        GarthHTTPError,
+        GarminConnectAuthenticationError,
+    )
+
     try:
         logger.info(
-            f"Trying to login to Garmin Connect using token data from the tokenstore directory ...\n"
+            "Trying to login to Garmin Connect using token data from %s ...",
+            oauth_repo.dir_path,
         )
 
+        stale_oauth = _get_stored_oauth(oauth_repo)
         garmin = Garmin(oauth_repo, garmin_connect_configuration)
         garmin.login()
 
-    except (Exception, FileNotFoundError, GarthHTTPError, GarminConnectAuthenticationError):
-        logger.info(
-            "Login tokens not present, login with your Garmin Connect credentials to generate them.\n"
-            f"They will be stored in tokenstore for future use.\n"
-        )
-        try:
-            garmin = Garmin(
-                oauth_repo,
-                garmin_connect_configuration,
-                prompt_mfa=get_mfa,
-            )
-            garmin.login(use_creds=True)
+    except token_errors as err:
+        logger.info("Token login failed with %s: %s", type(err).__name__, err)
 
-            # Save Oauth1 and Oauth2 token files to directory for next login
-            garmin.garth.dumps()
+        # Only one worker logs in with credentials; the others wait here
+        # and pick up the tokens it stored
+        with oauth_repo.lock():
+            if _get_stored_oauth(oauth_repo) not in (None, stale_oauth):
+                logger.info("Login tokens were refreshed by another worker, reusing them.")
+                try:
+                    garmin = Garmin(oauth_repo, garmin_connect_configuration)
+                    garmin.login()
+                    return garmin
+                except token_errors as err:
+                    logger.info("Refreshed tokens failed too with %s: %s", type(err).__name__, err)
 
             logger.info(
-                f"Oauth tokens stored in tokenstore directory for future use. (first method)\n"
+                "Login tokens not present, login with your Garmin Connect credentials to generate them. "
+                "They will be stored in %s for future use.",
+                oauth_repo.dir_path,
             )
-        except (
-            FileNotFoundError,
-            GarthHTTPError,
-            GarminConnectAuthenticationError,
-            requests.exceptions.HTTPError,
-        ) as err:
-            logger.error(err)
-            return None
+            try:
+                garmin = Garmin(
+                    oauth_repo,
+                    garmin_connect_configuration,
+                    prompt_mfa=get_mfa,
+                )
+                garmin.login(use_creds=True)
+
+                # Save Oauth1 and Oauth2 token files to directory for next login
+                garmin.garth.dumps()
+
+                logger.info("Oauth tokens stored in %s for future use.", oauth_repo.dir_path)
+            except (
+                FileNotFoundError,
+                GarthHTTPError,
+                GarminConnectAuthenticationError,
+                requests.exceptions.HTTPError,
+            ) as err:
+                logger.error(err)
+                return None
 
     return garmin
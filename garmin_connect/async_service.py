@@ -0,0 +1,63 @@
+"""Asyncio interface to the Garmin Connect service."""
+
+import asyncio
+import functools
+import inspect
+from typing import Any, Dict, List, Tuple, Union
+
+from garmin_connect.service import Garmin
+
+__all__ = ["AsyncGarmin"]
+
+
+class AsyncGarmin:
+    """
+    Expose the methods of a Garmin instance as coroutines, so independent
+    requests can be awaited together, e.g. with asyncio.gather.
+
+    Every call runs the synchronous method in the default executor, sharing
+    the wrapped instance's HTTP session and OAuth tokens.
+    """
+
+    def __init__(self, garmin: Garmin):
+        self.garmin = garmin
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self.garmin, name)
+        if name.startswith("_") or not inspect.ismethod(attribute):
+            return attribute
+
+        @functools.wraps(attribute)
+        async def method(*args, **kwargs):
+            return await asyncio.to_thread(attribute, *args, **kwargs)
+
+        return method
+
+    async def get_activities_bulk(
+            self,
+            activity_ids: List[Union[int, str]],
+            fetchers: Tuple[str, ...] = ("summary", "splits", "weather"),
+            workers: int = 16,
+    ) -> Dict[Union[int, str], Dict[str, Any]]:
+        """
+        Garmin.get_activities_bulk() with one asyncio.gather over all
+        (activity, fetcher) pairs, at most 'workers' of them in flight.
+        """
+        unknown = set(fetchers) - Garmin._ACTIVITY_FETCHERS.keys()
+        if unknown:
+            raise ValueError(f"Unexpected fetchers {sorted(unknown)}")
+
+        work = [(activity_id, fetcher) for activity_id in activity_ids for fetcher in fetchers]
+        semaphore = asyncio.Semaphore(min(workers, self.garmin.garth.pool_maxsize))
+
+        async def fetch(activity_id, fetcher):
+            async with semaphore:
+                return await getattr(self, Garmin._ACTIVITY_FETCHERS[fetcher])(activity_id)
+
+        results = await asyncio.gather(*(fetch(activity_id, fetcher) for activity_id, fetcher in work))
+
+        activities: Dict[Union[int, str], Dict[str, Any]] = {}
+        for (activity_id, fetcher), result in zip(work, results):
+            activities.setdefault(activity_id, {})[fetcher] = result
+
+        return activities
@@ -1,12 +1,22 @@
+from functools import lru_cache
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-__all__ = ["garmin_connect_configuration", "GarminConnectConfiguration"]
+__all__ = [
+    "garmin_connect_configuration",
+    "get_garmin_connect_configuration",
+    "GarminConnectConfiguration",
+]
 
 
 class GarminConnectConfiguration(BaseSettings):
     model_config = SettingsConfigDict(
-        env_prefix="garmin_connect_", env_file="../.env", extra="allow"
+        env_prefix="garmin_connect_",
+        env_file="../.env",
+        env_file_encoding="utf-8",
+        extra="allow",
+        frozen=True,
     )
 
     email: str
@@ -14,4 +24,16 @@ class GarminConnectConfiguration(BaseSettings):
     tokenstore: str = Field(default="~/.garminconnect")
 
 
-garmin_connect_configuration = GarminConnectConfiguration()
+@lru_cache(maxsize=1)
+def get_garmin_connect_configuration() -> GarminConnectConfiguration:
+    """Build the configuration from the environment once and reuse it."""
+    return GarminConnectConfiguration()
+
+
+def __getattr__(name: str):
+    # Keep `garmin_connect_configuration` importable without reading the
+    # environment and .env file at import time
+    if name == "garmin_connect_configuration":
+        return get_garmin_connect_configuration()
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
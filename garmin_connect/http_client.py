@@ -1,23 +1,212 @@
+import logging
+import random
+import shutil
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, BinaryIO, Optional, Tuple, Union
+
+from requests import Response
 from typing_extensions import override
 
 from garth import Client
+from garth.exc import GarthHTTPError
 
+from garmin_connect.exceptions import GarminConnectTooManyRequestsError
 from garmin_connect.repository import BaseOAuthRepository
+from garmin_connect.utils import json_dumps, json_loads
+
+logger = logging.getLogger(__name__)
+
+
+class _RateLimiter:
+    """
+    Token bucket shared by all threads using a client: allows 'rate'
+    requests per second on average and bursts of up to 'burst'. The rate
+    is halved on every rate limit response and recovers slowly on success.
+    """
+
+    min_rate = 0.5
+    recovery_step = 0.1
+
+    def __init__(self, rate: float = 10.0, burst: int = 20):
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._condition = threading.Condition()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self):
+        """Block until a request may be sent."""
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                if now >= self._paused_until and self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                wait = max(self._paused_until - now, (1 - self._tokens) / self.rate)
+                self._condition.wait(wait)
+
+    def succeeded(self):
+        with self._condition:
+            self.rate = min(self.max_rate, self.rate + self.recovery_step)
+
+    def rate_limited(self, retry_after: Optional[float] = None):
+        """Slow down after a 429, pausing all threads for 'retry_after' seconds."""
+        with self._condition:
+            self._refill(time.monotonic())
+            self.rate = max(self.min_rate, self.rate / 2)
+            if retry_after:
+                self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+            self._condition.notify_all()
+
+
+def _get_retry_after(e: GarthHTTPError) -> Optional[float]:
+    """Return the Retry-After seconds of a 429 response, if given as a number."""
+    retry_after = e.error.response.headers.get("Retry-After", "")
+
+    return float(retry_after) if retry_after.isdigit() else None
 
 
 class GarminConnectHTTPClient(Client):
+    # garth mounts its retrying HTTPAdapter with these pool sizes; keep
+    # enough keep-alive connections for the concurrent fan-out helpers
+    pool_connections: int = 10
+    pool_maxsize: int = 20
+    # Retried with exponential backoff by urllib3. 429 is left out so that
+    # every one reaches the rate limiter, which retries it itself
+    retries: int = 5
+    status_forcelist = tuple(status for status in Client.status_forcelist if status != 429)
+    rate_limit_retries: int = 5
+
+    # Requests per second allowed across all threads, and the burst size
+    rate_limit: float = 10.0
+    rate_limit_burst: int = 20
+
     def __init__(self, repository: BaseOAuthRepository, *args, **kwargs):
+        self._refresh_lock = threading.Lock()
         super().__init__(*args, **kwargs)
         self.repository = repository
+        self.rate_limiter = _RateLimiter(self.rate_limit, self.rate_limit_burst)
+
+        # Response cache of the Garmin instances sharing this client:
+        # (url, sorted params) -> (time.monotonic() of the fetch, raw body,
+        # ETag, Last-Modified), least recently used first
+        self.response_cache: "OrderedDict[Tuple[str, Tuple], Tuple[float, bytes, Optional[str], Optional[str]]]" = (
+            OrderedDict()
+        )
+        self.response_cache_lock = threading.Lock()
+
+    @override
+    def refresh_oauth2(self):
+        # Concurrent workers all see the expired token; only the first
+        # exchanges it, the others wait and use the new one
+        with self._refresh_lock:
+            if self.oauth2_token and not self.oauth2_token.expired:
+                return
+            super().refresh_oauth2()
+
+    @override
+    def request(
+        self,
+        method: str,
+        subdomain: str,
+        path: str,
+        /,
+        api: bool = False,
+        referrer: Union[str, bool] = False,
+        headers: Optional[dict] = None,
+        **kwargs,
+    ):
+        # Copy the headers so garth never mutates a dict shared between calls
+        headers = dict(headers or {})
+
+        # Encode JSON bodies with orjson (when installed) rather than letting
+        # requests fall back to the stdlib encoder
+        payload = kwargs.pop("json", None)
+        if payload is not None:
+            headers["Content-Type"] = "application/json"
+            kwargs["data"] = json_dumps(payload)
+
+        # Uploaded files are consumed by the first attempt
+        retries = 0 if "files" in kwargs else self.rate_limit_retries
+
+        for attempt in range(retries + 1):
+            self.rate_limiter.acquire()
+            try:
+                resp = super().request(
+                    method, subdomain, path, api=api, referrer=referrer, headers=headers, **kwargs
+                )
+            except GarthHTTPError as e:
+                response = e.error.response
+                if response is None or response.status_code != 429:
+                    raise
+
+                # Pause every thread for Retry-After, or else an exponential
+                # backoff with jitter, and slow down afterwards
+                pause = _get_retry_after(e) or self.backoff_factor * 2 ** attempt * (0.5 + random.random())
+                self.rate_limiter.rate_limited(pause)
+                if attempt == retries:
+                    raise GarminConnectTooManyRequestsError(str(e)) from e
+                logger.debug("Rate limited on %s, retrying in %.1fs", path, pause)
+            else:
+                self.rate_limiter.succeeded()
+                return resp
+
+    @staticmethod
+    def decode_json(content: bytes) -> Any:
+        """Return the decoded JSON of a connectapi body; None if it is empty."""
+        if not content:
+            return None
+
+        # Empty list pages end pagination; no need to run the decoder on them
+        if content == b"[]":
+            return []
+
+        # Parse the raw body with orjson (when installed) rather than the
+        # stdlib decoder behind resp.json()
+        return json_loads(content)
+
+    @classmethod
+    def parse_json(cls, resp: Response) -> Any:
+        """Return the decoded JSON body of a connectapi response."""
+        if resp.status_code == 204:
+            return None
+
+        return cls.decode_json(resp.content)
+
+    @override
+    def connectapi(self, path: str, method="GET", **kwargs):
+        resp = self.request(method, "connectapi", path, api=True, **kwargs)
+
+        return self.parse_json(resp)
+
+    def download_to(self, path: str, fileobj: BinaryIO, chunk_size: int = 65536, **kwargs):
+        """Stream the body of `path` into `fileobj` instead of buffering it in memory."""
+        resp = self.request("GET", "connectapi", path, api=True, stream=True, **kwargs)
+        with resp:
+            # Undo any Content-Encoding, as resp.content would
+            resp.raw.decode_content = True
+            shutil.copyfileobj(resp.raw, fileobj, chunk_size)
 
     @override
     def loads(self):
         oauth1, oauth2 = self.repository.get_oauth()
-        self.configure(
-            oauth1_token=oauth1,
-            oauth2_token=oauth2,
-            domain=oauth1.domain,
-        )
+        # Client.configure() mounts a new HTTPAdapter, which throws away the
+        # pooled keep-alive connections; only the tokens and domain change here
+        self.oauth1_token = oauth1
+        self.oauth2_token = oauth2
+        if oauth1.domain:
+            self.domain = oauth1.domain
 
     def dumps(self):
-        self.repository.set_oauth(self.oauth1_token, self.oauth2_token)
\ No newline at end of file
+        self.repository.set_oauth(self.oauth1_token, self.oauth2_token)
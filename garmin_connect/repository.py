@@ -1,16 +1,38 @@
+from __future__ import annotations
+
 import logging
 import os
+import threading
 from abc import ABC, abstractmethod
-from typing import Tuple
-import json
-from garth.utils import asdict
-from garth.auth_tokens import OAuth1Token, OAuth2Token
+from contextlib import contextmanager, nullcontext
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, ContextManager, Iterator, Optional, Tuple
+
+from garmin_connect.exceptions import GarminConnectAuthenticationError
+from garmin_connect.utils import json_dumps, json_loads
+
+if TYPE_CHECKING:
+    from garth.auth_tokens import OAuth1Token, OAuth2Token
 
-__all__ = ["BaseOAuthRepository"]
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+__all__ = ["BaseOAuthRepository", "InMemoryOAuthRepository"]
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _ensure_dir(dir_path: str) -> str:
+    """Expand and create `dir_path` once per process."""
+    dir_path = os.path.expanduser(dir_path)
+    os.makedirs(dir_path, exist_ok=True)
+    return dir_path
+
+
 class BaseOAuthRepository(ABC):
     @abstractmethod
     def get_oauth(self) -> Tuple[OAuth1Token, OAuth2Token]:
@@ -20,34 +42,163 @@ class BaseOAuthRepository(ABC):
     def set_oauth(self, oauth1_token: OAuth1Token, oauth2_token: OAuth2Token) -> bool:
         pass
 
+    def lock(self) -> ContextManager:
+        """Serialize token refreshes; repositories shared between workers override it."""
+        return nullcontext()
 
-class FileOAuthRepository(BaseOAuthRepository):
-    def __init__(self, dir_path: str):
-        self.dir_path = os.path.expanduser(dir_path)
-        os.makedirs(self.dir_path, exist_ok=True)
+
+class InMemoryOAuthRepository(BaseOAuthRepository):
+    """
+    Keep tokens in memory only, e.g. for tests or when tokens come from a
+    secret manager rather than the local filesystem.
+    """
+
+    def __init__(
+        self,
+        oauth1_token: Optional[OAuth1Token] = None,
+        oauth2_token: Optional[OAuth2Token] = None,
+    ):
+        self._oauth1_token = oauth1_token
+        self._oauth2_token = oauth2_token
 
     def get_oauth(self) -> Tuple[OAuth1Token, OAuth2Token]:
-        oauth1_file = os.path.join(self.dir_path, "oauth1_token.json")
-        oauth2_file = os.path.join(self.dir_path, "oauth2_token.json")
+        if self._oauth1_token is None or self._oauth2_token is None:
+            raise GarminConnectAuthenticationError("No OAuth tokens stored")
+
+        return self._oauth1_token, self._oauth2_token
+
+    def set_oauth(self, oauth1_token: OAuth1Token, oauth2_token: OAuth2Token) -> bool:
+        if oauth1_token:
+            self._oauth1_token = oauth1_token
+        if oauth2_token:
+            self._oauth2_token = oauth2_token
+
+        return True
+
+
+class FileOAuthRepository(BaseOAuthRepository):
+    def __init__(self, dir_path: str, durable: bool = False):
+        """
+        `durable` fsyncs tokens.json and its directory on every write, so
+        the tokens survive a power loss, not only a process crash.
+        """
+        self.dir_path = _ensure_dir(dir_path)
+        self.durable = durable
+
+        path = Path(self.dir_path)
+        self._tokens_path = path / "tokens.json"
+        self._lock_path = path / "tokens.lock"
+        self._tmp_path = path / "tokens.json.tmp"
+        self._oauth1_path = path / "oauth1_token.json"
+        self._oauth2_path = path / "oauth2_token.json"
+
+        self._lock = threading.RLock()
+        self._lock_depth = 0
+        self._lock_file = None
 
-        with open(oauth1_file) as f:
-            oauth1 = OAuth1Token(**json.load(f))
-        with open(oauth2_file) as f:
-            oauth2 = OAuth2Token(**json.load(f))
+        # Parsed tokens and the mtime of the file they were read from
+        self._cache: Optional[Tuple[OAuth1Token, OAuth2Token]] = None
+        self._cache_mtime: Optional[int] = None
+
+    @contextmanager
+    def lock(self) -> Iterator[None]:
+        """
+        Hold an exclusive lock on the token store, both across threads and
+        (where fcntl is available) across processes sharing the directory.
+        The lock is reentrant within a thread.
+        """
+        with self._lock:
+            if self._lock_depth == 0:
+                self._lock_file = open(self._lock_path, "ab")
+                if fcntl is not None:
+                    fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_EX)
+            self._lock_depth += 1
+
+            try:
+                yield
+            finally:
+                self._lock_depth -= 1
+                if self._lock_depth == 0:
+                    if fcntl is not None:
+                        fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_UN)
+                    self._lock_file.close()
+                    self._lock_file = None
+
+    def _fsync_dir(self):
+        """Persist the directory entry created by os.replace."""
+        if not hasattr(os, "O_DIRECTORY"):  # Windows
+            return
+
+        dir_fd = os.open(self.dir_path, os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+    def _get_legacy_oauth(self) -> Tuple[OAuth1Token, OAuth2Token]:
+        """Read tokens stored in the old oauth1_token.json/oauth2_token.json layout."""
+        from garth.auth_tokens import OAuth1Token, OAuth2Token
+
+        oauth1 = OAuth1Token(**json_loads(self._oauth1_path.read_bytes()))
+        oauth2 = OAuth2Token(**json_loads(self._oauth2_path.read_bytes()))
 
         return oauth1, oauth2
 
+    def _is_cache_current(self) -> bool:
+        """Whether tokens.json is still the file the cache was filled from."""
+        try:
+            return self._cache_mtime == os.stat(self._tokens_path).st_mtime_ns
+        except FileNotFoundError:
+            return False
+
+    def get_oauth(self) -> Tuple[OAuth1Token, OAuth2Token]:
+        try:
+            mtime = os.stat(self._tokens_path).st_mtime_ns
+        except FileNotFoundError:
+            logger.debug("%s not found, falling back to legacy token files", self._tokens_path)
+            return self._get_legacy_oauth()
+
+        if self._cache is not None and self._cache_mtime == mtime:
+            return self._cache
+
+        from garth.auth_tokens import OAuth1Token, OAuth2Token
+
+        data = json_loads(self._tokens_path.read_bytes())
+
+        self._cache = OAuth1Token(**data["oauth1"]), OAuth2Token(**data["oauth2"])
+        self._cache_mtime = mtime
+
+        return self._cache
+
     def set_oauth(self, oauth1_token: OAuth1Token, oauth2_token: OAuth2Token) -> bool:
-        if oauth1_token:
-            path = os.path.join(self.dir_path, "oauth1_token.json")
-            os.remove(path)
+        from garth.utils import asdict
 
-            with open(path, "w", encoding='utf-8') as f:
-                json.dump(asdict(oauth1_token), f, ensure_ascii=False, indent=4)
+        with self.lock():
+            if not (oauth1_token and oauth2_token):
+                # Keep whichever token is not being replaced
+                current_oauth1, current_oauth2 = self.get_oauth()
+                oauth1_token = oauth1_token or current_oauth1
+                oauth2_token = oauth2_token or current_oauth2
 
-        if oauth2_token:
-            path = os.path.join(self.dir_path, "oauth2_token.json")
-            os.remove(path)
+            if (oauth1_token, oauth2_token) == self._cache and self._is_cache_current():
+                # Nothing changed since the last read or write
+                return True
+
+            data = {"oauth1": asdict(oauth1_token), "oauth2": asdict(oauth2_token)}
+
+            # Write to a temporary file and swap it in, so a crash mid-write
+            # never leaves a truncated tokens.json behind
+            with open(self._tmp_path, "wb") as f:
+                f.write(json_dumps(data))
+                if self.durable:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(self._tmp_path, self._tokens_path)
+
+            if self.durable:
+                self._fsync_dir()
+
+            self._cache = (oauth1_token, oauth2_token)
+            self._cache_mtime = os.stat(self._tokens_path).st_mtime_ns
 
-            with open(path, "w", encoding='utf-8') as f:
-                json.dump(asdict(oauth2_token), f, ensure_ascii=False, indent=4)
+        return True
@@ -2,11 +2,19 @@
 
 import logging
 import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timezone
 from enum import Enum, auto
-from typing import Any, Dict, List, Optional, Union
+from functools import lru_cache, partial
+from itertools import chain
+from types import CodeType
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
-from withings_sync import fit
+import requests
+from garth.exc import GarthHTTPError
 
 from garmin_connect.configuration import GarminConnectConfiguration
 from garmin_connect.constants import API_URLS, ACTIVITY_VISIBILITIES
@@ -16,14 +24,110 @@ from garmin_connect.exceptions import (
 )
 from garmin_connect.http_client import GarminConnectHTTPClient
 from garmin_connect.repository import BaseOAuthRepository
-from garmin_connect.utils import get_caller_name
 
 logger = logging.getLogger(__name__)
 
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S.00"
+
+# How long the device list fetched for get_device_alarms is reused
+DEVICES_CACHE_TTL = 300
+
+# How long responses of endpoints that rarely or never change are reused
+ACTIVITY_TYPES_CACHE_TTL = 24 * 60 * 60
+ACTIVITY_CACHE_TTL = 60 * 60
+PROFILE_CACHE_TTL = 300
+
+# Page size tried first for paginated listings, and the web interface's
+# page size used when Garmin rejects it
+DEFAULT_PAGE_LIMIT = 200
+WEB_PAGE_LIMIT = 20
+
+# Upper bound on the number of cached responses per HTTP client
+RESPONSE_CACHE_MAXSIZE = 4096
+
+# Authenticated HTTP clients keyed by account email, shared by all Garmin
+# instances of that account and token repository so a warm process logs in
+# only once
+_http_clients: Dict[str, GarminConnectHTTPClient] = {}
+_http_clients_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _get_url_template(code: CodeType) -> str:
+    """Return the API_URLS template of the method that `code` belongs to."""
+    return API_URLS.get(code.co_name, "")
+
 
 class Garmin:
     """Class for fetching data from Garmin Connect."""
 
+    __slots__ = (
+        "username",
+        "password",
+        "prompt_mfa",
+        "display_name",
+        "_display_name_urls",
+        "full_name",
+        "unit_system",
+        "garth",
+        "_privacy_blocked",
+        "_devices_cache",
+    )
+
+    garmin_connect_hill_score_url = "/metrics-service/metrics/hillscore"
+
+    garmin_connect_endurance_score_url = (
+        "/metrics-service/metrics/endurancescore"
+    )
+
+    garmin_connect_pregnancy_snapshot_url = (
+        "periodichealth-service/menstrualcycle/pregnancysnapshot"
+    )
+    garmin_connect_goals_url = "/goal-service/goal/goals"
+
+    garmin_connect_hrv_url = "/hrv-service/hrv"
+
+    garmin_connect_training_readiness_url = (
+        "/metrics-service/metrics/trainingreadiness"
+    )
+
+    garmin_connect_race_predictor_url = (
+        "/metrics-service/metrics/racepredictions"
+    )
+    garmin_connect_training_status_url = (
+        "/metrics-service/metrics/trainingstatus/aggregated"
+    )
+    garmin_connect_user_summary_chart = (
+        "/wellness-service/wellness/dailySummaryChart"
+    )
+    garmin_connect_floors_chart_daily_url = (
+        "/wellness-service/wellness/floorsChartData/daily"
+    )
+    garmin_connect_heartrates_daily_url = (
+        "/wellness-service/wellness/dailyHeartRate"
+    )
+    garmin_connect_daily_respiration_url = (
+        "/wellness-service/wellness/daily/respiration"
+    )
+
+    garmin_connect_fit_download = "/download-service/files/activity"
+    garmin_connect_tcx_download = "/download-service/export/tcx/activity"
+    garmin_connect_gpx_download = "/download-service/export/gpx/activity"
+    garmin_connect_kml_download = "/download-service/export/kml/activity"
+    garmin_connect_csv_download = "/download-service/export/csv/activity"
+
+    garmin_connect_gear = "/gear-service/gear/filterGear"
+    garmin_connect_gear_baseurl = "/gear-service/gear/"
+
+    garmin_request_reload_url = "/wellness-service/wellness/epoch/request"
+
+    garmin_workouts = "/workout-service"
+
+    garmin_connect_delete_activity_url = "/activity-service/activity"
+
+    # Page size each paginated endpoint was found to accept, by API_URLS name
+    _PAGE_LIMIT_CAP: Dict[str, int] = {}
+
     def __init__(
             self,
             oauth_repository: BaseOAuthRepository,
@@ -36,70 +140,78 @@ class Garmin:
 
         self.prompt_mfa = prompt_mfa
 
-        self.display_name = None
+        self._set_display_name(None)
         self.full_name = None
         self.unit_system = None
 
-        self.garth = GarminConnectHTTPClient(
-            repository=oauth_repository,
-            domain="garmin.com"
-        )
+        # Set once the daily summary is found to be privacy protected
+        self._privacy_blocked = False
 
-        self.garmin_connect_hill_score_url = "/metrics-service/metrics/hillscore"
+        # (time.monotonic() of the fetch, devices)
+        self._devices_cache: Optional[Tuple[float, List[Dict[str, Any]]]] = None
 
-        self.garmin_connect_endurance_score_url = (
-            "/metrics-service/metrics/endurancescore"
-        )
+        with _http_clients_lock:
+            client = _http_clients.get(self.username)
+            # A client bound to another repository would read and store the
+            # tokens in the wrong place; replace it for new instances
+            if client is None or client.repository is not oauth_repository:
+                client = GarminConnectHTTPClient(
+                    repository=oauth_repository,
+                    domain="garmin.com"
+                )
+                _http_clients[self.username] = client
+        self.garth = client
 
-        self.garmin_connect_pregnancy_snapshot_url = (
-            "periodichealth-service/menstrualcycle/pregnancysnapshot"
-        )
-        self.garmin_connect_goals_url = "/goal-service/goal/goals"
+    def __enter__(self):
+        return self
 
-        self.garmin_connect_hrv_url = "/hrv-service/hrv"
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
 
-        self.garmin_connect_training_readiness_url = (
-            "/metrics-service/metrics/trainingreadiness"
-        )
+    def close(self):
+        """Close the pooled connections of this account's HTTP client."""
 
-        self.garmin_connect_race_predictor_url = (
-            "/metrics-service/metrics/racepredictions"
-        )
-        self.garmin_connect_training_status_url = (
-            "/metrics-service/metrics/trainingstatus/aggregated"
-        )
-        self.garmin_connect_user_summary_chart = (
-            "/wellness-service/wellness/dailySummaryChart"
-        )
-        self.garmin_connect_floors_chart_daily_url = (
-            "/wellness-service/wellness/floorsChartData/daily"
-        )
-        self.garmin_connect_heartrates_daily_url = (
-            "/wellness-service/wellness/dailyHeartRate"
-        )
-        self.garmin_connect_daily_respiration_url = (
-            "/wellness-service/wellness/daily/respiration"
-        )
+        with _http_clients_lock:
+            if _http_clients.get(self.username) is self.garth:
+                del _http_clients[self.username]
+        self.garth.sess.close()
 
-        self.garmin_connect_fit_download = "/download-service/files/activity"
-        self.garmin_connect_tcx_download = "/download-service/export/tcx/activity"
-        self.garmin_connect_gpx_download = "/download-service/export/gpx/activity"
-        self.garmin_connect_kml_download = "/download-service/export/kml/activity"
-        self.garmin_connect_csv_download = "/download-service/export/csv/activity"
+    @staticmethod
+    def get_url(**url_params) -> str:
+        # The template is looked up by the name of the calling method; the
+        # lookup is cached per code object so it runs once per method
+        url_template = _get_url_template(sys._getframe(1).f_code)
+        if not url_params:
+            return url_template
 
-        self.garmin_connect_gear = "/gear-service/gear/filterGear"
-        self.garmin_connect_gear_baseurl = "/gear-service/gear/"
+        return url_template.format(**url_params)
 
-        self.garmin_request_reload_url = "/wellness-service/wellness/epoch/request"
+    @staticmethod
+    def _get_local_and_gmt_timestamps(timestamp: str) -> Tuple[str, str]:
+        """
+        Return 'timestamp' (ISO format, defaults to now) as local and GMT
+        strings in the format the weight and blood pressure services expect.
+        """
+        dt = datetime.fromisoformat(timestamp) if timestamp else datetime.now()
+        # Apply timezone offset to get UTC/GMT time
+        return dt.strftime(TIMESTAMP_FORMAT), dt.astimezone(timezone.utc).strftime(TIMESTAMP_FORMAT)
 
-        self.garmin_workouts = "/workout-service"
+    def concurrent_fetch(self, *fetchers: Callable[[], Any], max_workers: int = 8) -> List[Any]:
+        """
+        Call independent zero-argument 'fetchers', e.g.
+        functools.partial(self.get_sleep_data, cdate), concurrently and
+        return their results in the same order.
+        """
+        if not fetchers:
+            return []
 
-        self.garmin_connect_delete_activity_url = "/activity-service/activity"
+        # More threads than pooled connections would only open and discard
+        # extra TLS connections
+        max_workers = min(max_workers, self.garth.pool_maxsize, len(fetchers))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(fetcher) for fetcher in fetchers]
 
-    @staticmethod
-    def get_url(**url_params) -> str:
-        url = API_URLS.get(get_caller_name(), "").format(**url_params)
-        return url
+            return [future.result() for future in futures]
 
     def connectapi(self, path, **kwargs):
         return self.garth.connectapi(path, **kwargs)
@@ -107,6 +219,76 @@ class Garmin:
     def download(self, path, **kwargs):
         return self.garth.download(path, **kwargs)
 
+    def download_to(self, path, fileobj, **kwargs):
+        return self.garth.download_to(path, fileobj, **kwargs)
+
+    def _cached_connectapi(self, path: str, ttl: float, params: Optional[Dict[str, Any]] = None):
+        """
+        connectapi() for read-only endpoints, reusing a response fetched less
+        than 'ttl' seconds ago by any Garmin instance sharing this HTTP
+        client. Expired responses are revalidated with their
+        ETag/Last-Modified, so an unchanged body is not transferred again.
+        If Garmin cannot be reached, an expired response is returned rather
+        than failing.
+
+        The raw body is cached and decoded on every call, so callers get
+        their own objects and may modify them.
+        """
+        cache, cache_lock = self.garth.response_cache, self.garth.response_cache_lock
+        key = (path, tuple(sorted(params.items())) if params else ())
+        now = time.monotonic()
+
+        with cache_lock:
+            cached = cache.get(key)
+            if cached is not None:
+                cache.move_to_end(key)
+                if now - cached[0] < ttl:
+                    return self.garth.decode_json(cached[1])
+
+        headers = {}
+        if cached is not None:
+            if cached[2]:
+                headers["If-None-Match"] = cached[2]
+            if cached[3]:
+                headers["If-Modified-Since"] = cached[3]
+
+        try:
+            resp = self.garth.request(
+                "GET", "connectapi", path, api=True, params=params, headers=headers
+            )
+        except (requests.ConnectionError, requests.Timeout):
+            if cached is None:
+                raise
+            logger.warning("Garmin Connect unreachable, using cached response for %s", path)
+            return self.garth.decode_json(cached[1])
+
+        etag = resp.headers.get("ETag")
+        last_modified = resp.headers.get("Last-Modified")
+        if resp.status_code == 304 and cached is not None:
+            logger.debug("%s not modified, reusing cached response", path)
+            content = cached[1]
+            etag = etag or cached[2]
+            last_modified = last_modified or cached[3]
+        else:
+            content = b"" if resp.status_code == 204 else resp.content
+
+        with cache_lock:
+            cache[key] = (now, content, etag, last_modified)
+            cache.move_to_end(key)
+            if len(cache) > RESPONSE_CACHE_MAXSIZE:
+                cache.popitem(last=False)
+
+        return self.garth.decode_json(content)
+
+    def invalidate_response_cache(self):
+        """
+        Forget all cached responses of this account, e.g. after editing data
+        on the website.
+        """
+
+        with self.garth.response_cache_lock:
+            self.garth.response_cache.clear()
+
     def login(self, use_creds: bool = False):
         """Log in using Garth."""
         if use_creds:
@@ -114,15 +296,31 @@ class Garmin:
         else:
             self.garth.loads()
 
-        self.display_name = self.garth.profile.get("displayName")
+        self._privacy_blocked = False
+
+        self._set_display_name(self.garth.profile.get("displayName"))
         self.full_name = self.garth.profile.get("fullName")
 
-        user_settings_url = self.get_url()
+        user_settings_url = API_URLS["login"]
         settings = self.garth.connectapi(user_settings_url)
         self.unit_system = settings["userData"]["measurementSystem"]
 
         return True
 
+    def _set_display_name(self, display_name: Optional[str]):
+        """Set the display name and build the URLs that embed it."""
+
+        self.display_name = display_name
+        self._display_name_urls = {
+            "get_user_summary": API_URLS["get_user_summary"].format(display_name=display_name),
+            "get_personal_record": API_URLS["get_personal_record"].format(display_name=display_name),
+            "get_sleep_data": API_URLS["get_sleep_data"].format(display_name=display_name),
+            "get_rhr_day": API_URLS["get_rhr_day"].format(display_name=display_name),
+            "get_steps_data": f"{self.garmin_connect_user_summary_chart}/{display_name}",
+            "get_heart_rates": f"{self.garmin_connect_heartrates_daily_url}/{display_name}",
+            "get_race_predictions": f"{self.garmin_connect_race_predictor_url}/latest/{display_name}",
+        }
+
     def get_full_name(self):
         """Return full name."""
 
@@ -144,13 +342,18 @@ class Garmin:
     def get_user_summary(self, cdate: str) -> Dict[str, Any]:
         """Return user activity summary for 'cdate' format 'YYYY-MM-DD'."""
 
-        url = self.get_url(display_name=self.display_name)
-        params = {"calendarDate": str(cdate)}
+        if self._privacy_blocked:
+            # Every day of a privacy protected profile fails the same way
+            raise GarminConnectAuthenticationError("Authentication error")
+
+        url = self._display_name_urls["get_user_summary"]
+        params = {"calendarDate": cdate}
         logger.debug("Requesting user summary")
 
         response = self.connectapi(url, params=params)
 
         if response["privacyProtected"] is True:
+            self._privacy_blocked = True
             raise GarminConnectAuthenticationError("Authentication error")
 
         return response
@@ -158,8 +361,8 @@ class Garmin:
     def get_steps_data(self, cdate):
         """Fetch available steps data 'cDate' format 'YYYY-MM-DD'."""
 
-        url = f"{self.garmin_connect_user_summary_chart}/{self.display_name}"
-        params = {"date": str(cdate)}
+        url = self._display_name_urls["get_steps_data"]
+        params = {"date": cdate}
         logger.debug("Requesting steps data")
 
         return self.connectapi(url, params=params)
@@ -175,7 +378,7 @@ class Garmin:
     def get_daily_steps(self, start, end):
         """Fetch available steps data 'start' and 'end' format 'YYYY-MM-DD'."""
 
-        url = self.get_url(start=start, end=end)
+        url = API_URLS["get_daily_steps"].format(start=start, end=end)
         logger.debug("Requesting daily steps data")
 
         return self.connectapi(url)
@@ -183,8 +386,8 @@ class Garmin:
     def get_heart_rates(self, cdate):
         """Fetch available heart rates data 'cDate' format 'YYYY-MM-DD'."""
 
-        url = f"{self.garmin_connect_heartrates_daily_url}/{self.display_name}"
-        params = {"date": str(cdate)}
+        url = self._display_name_urls["get_heart_rates"]
+        params = {"date": cdate}
         logger.debug("Requesting heart rates")
 
         return self.connectapi(url, params=params)
@@ -192,10 +395,13 @@ class Garmin:
     def get_stats_and_body(self, cdate):
         """Return activity data and body composition (compat for garminconnect)."""
 
-        return {
-            **self.get_stats(cdate),
-            **self.get_body_composition(cdate)["totalAverage"],
-        }
+        stats, body_composition = self.concurrent_fetch(
+            partial(self.get_stats, cdate),
+            partial(self.get_body_composition, cdate),
+        )
+        stats.update(body_composition["totalAverage"])
+
+        return stats
 
     def get_body_composition(self, start_date: str, end_date=None) -> Dict[str, Any]:
         """
@@ -205,8 +411,8 @@ class Garmin:
 
         if end_date is None:
             end_date = start_date
-        url = self.get_url()
-        params = {"startDate": str(start_date), "endDate": str(end_date)}
+        url = API_URLS["get_body_composition"]
+        params = {"startDate": start_date, "endDate": end_date}
         logger.debug("Requesting body composition")
 
         return self.connectapi(url, params=params)
@@ -227,6 +433,9 @@ class Garmin:
             visceral_fat_rating: Optional[float] = None,
             bmi: Optional[float] = None,
     ):
+        # Only this method needs the FIT encoder, so import it on first use
+        from withings_sync import fit
+
         dt = datetime.fromisoformat(timestamp) if timestamp else datetime.now()
         fitEncoder = fit.FitEncoderWeight()
         fitEncoder.write_file_info()
@@ -250,21 +459,21 @@ class Garmin:
         fitEncoder.finish()
 
         url = API_URLS.get("upload_activity")  # TODO revoke
+        # Hand the encoder's buffer over as a memoryview instead of copying
+        # it into a new bytes object with getvalue()
         files = {
-            "file": ("body_composition.fit", fitEncoder.getvalue()),
+            "file": ("body_composition.fit", fitEncoder.buf.getbuffer()),
         }
         return self.garth.post("connectapi", url, files=files, api=True)
 
     def add_weigh_in(self, weight: int, unitKey: str = "kg", timestamp: str = ""):
         """Add a weigh-in (default to kg)"""
 
-        url = self.get_url()
-        dt = datetime.fromisoformat(timestamp) if timestamp else datetime.now()
-        # Apply timezone offset to get UTC/GMT time
-        dtGMT = dt.astimezone(timezone.utc)
+        url = API_URLS["add_weigh_in"]
+        local_timestamp, gmt_timestamp = self._get_local_and_gmt_timestamps(timestamp)
         payload = {
-            "dateTimestamp": dt.isoformat()[:19] + ".00",
-            "gmtTimestamp": dtGMT.isoformat()[:19] + ".00",
+            "dateTimestamp": local_timestamp,
+            "gmtTimestamp": gmt_timestamp,
             "unitKey": unitKey,
             "sourceType": "MANUAL",
             "value": weight,
@@ -276,7 +485,7 @@ class Garmin:
     def get_weigh_ins(self, start_date: str, end_date: str):
         """Get weigh-ins between start_date and end_date using format 'YYYY-MM-DD'."""
 
-        url = self.get_url(start_date=start_date, end_date=end_date)
+        url = API_URLS["get_weigh_ins"].format(start_date=start_date, end_date=end_date)
         params = {"includeAll": True}
         logger.debug("Requesting weigh-ins")
 
@@ -285,7 +494,7 @@ class Garmin:
     def get_daily_weigh_ins(self, cdate: str):
         """Get weigh-ins for 'cdate' format 'YYYY-MM-DD'."""
 
-        url = self.get_url(cdate=cdate)
+        url = API_URLS["get_daily_weigh_ins"].format(cdate=cdate)
         params = {"includeAll": True}
         logger.debug("Requesting weigh-ins")
 
@@ -293,7 +502,7 @@ class Garmin:
 
     def delete_weigh_in(self, weight_pk: str, cdate: str):
         """Delete specific weigh-in."""
-        url = self.get_url(weight_pk=weight_pk, cdate=cdate)
+        url = API_URLS["delete_weigh_in"].format(weight_pk=weight_pk, cdate=cdate)
         logger.debug("Deleting weigh-in")
 
         return self.garth.request(
@@ -322,8 +531,10 @@ class Garmin:
                 )
                 return
 
-        for w in weigh_ins:
-            self.delete_weigh_in(w["samplePk"], cdate)
+        self.concurrent_fetch(
+            *(partial(self.delete_weigh_in, w["samplePk"], cdate) for w in weigh_ins),
+            max_workers=4,
+        )
 
         return len(weigh_ins)
 
@@ -333,12 +544,24 @@ class Garmin:
         'YYYY-MM-DD' through end_date 'YYYY-MM-DD'
         """
         end_date = end_date if end_date is not None else start_date
-        params = {"startDate": str(start_date), "endDate": str(end_date)}
+        params = {"startDate": start_date, "endDate": end_date}
 
-        url = self.get_url()
+        url = API_URLS["get_body_battery"]
         logger.debug("Requesting body battery data")
         return self.connectapi(url, params=params)
 
+    def get_body_battery_range(self, start_date: str, end_date: str) -> Dict[date, Dict[str, Any]]:
+        """
+        Return body battery values for 'start_date' through 'end_date' format
+        'YYYY-MM-DD', keyed by day. Fetches the whole range in one request;
+        prefer it over calling `get_body_battery` for each day.
+        """
+
+        return {
+            date.fromisoformat(day["date"]): day
+            for day in self.get_body_battery(start_date, end_date) or []
+        }
+
     def get_body_battery_events(self, cdate: str) -> List[Dict[str, Any]]:
         """
         Return body battery events for date 'cdate' format 'YYYY-MM-DD'.
@@ -346,7 +569,7 @@ class Garmin:
         Events can include sleep, recorded activities, auto-detected activities, and naps
         """
 
-        url = self.get_url(cdate=cdate)
+        url = API_URLS["get_body_battery_events"].format(cdate=cdate)
         logger.debug("Requesting body battery event data")
 
         return self.connectapi(url)
@@ -363,13 +586,11 @@ class Garmin:
         Add blood pressure measurement
         """
 
-        url = self.get_url()
-        dt = datetime.fromisoformat(timestamp) if timestamp else datetime.now()
-        # Apply timezone offset to get UTC/GMT time
-        dtGMT = dt.astimezone(timezone.utc)
+        url = API_URLS["set_blood_pressure"]
+        local_timestamp, gmt_timestamp = self._get_local_and_gmt_timestamps(timestamp)
         payload = {
-            "measurementTimestampLocal": dt.isoformat()[:19] + ".00",
-            "measurementTimestampGMT": dtGMT.isoformat()[:19] + ".00",
+            "measurementTimestampLocal": local_timestamp,
+            "measurementTimestampGMT": gmt_timestamp,
             "systolic": systolic,
             "diastolic": diastolic,
             "pulse": pulse,
@@ -388,16 +609,29 @@ class Garmin:
         """
         end_date = end_date if end_date is not None else start_date
 
-        url = self.get_url(start_date=start_date, end_date=end_date)
+        url = API_URLS["get_blood_pressure"].format(start_date=start_date, end_date=end_date)
         params = {"includeAll": True}
         logger.debug("Requesting blood pressure data")
 
         return self.connectapi(url, params=params)
 
+    def get_blood_pressure_range(self, start_date: str, end_date: str) -> Dict[date, Dict[str, Any]]:
+        """
+        Return blood pressure summaries for 'start_date' through 'end_date'
+        format 'YYYY-MM-DD', keyed by day. Fetches the whole range in one
+        request; prefer it over calling `get_blood_pressure` for each day.
+        """
+
+        response = self.get_blood_pressure(start_date, end_date)
+        return {
+            date.fromisoformat(summary["startDate"]): summary
+            for summary in response.get("measurementSummaries") or []
+        }
+
     def get_max_metrics(self, cdate: str) -> Dict[str, Any]:
         """Return available max metric data for 'cdate' format 'YYYY-MM-DD'."""
 
-        url = self.get_url(cdate=cdate)
+        url = API_URLS["get_max_metrics"].format(cdate=cdate)
         logger.debug("Requesting max metrics")
 
         return self.connectapi(url)
@@ -411,20 +645,17 @@ class Garmin:
         :param date optional - cdate: The date of the weigh in, format 'YYYY-MM-DD'. Defaults to current date
         """
 
-        url = self.get_url()
+        url = API_URLS["add_hydration_data"]
 
         if timestamp is None and cdate is None:
             # If both are null, use today and now
-            raw_date = date.today()
-            cdate = str(raw_date)
-
             raw_ts = datetime.now()
-            timestamp = datetime.strftime(raw_ts, "%Y-%m-%dT%H:%M:%S.%f")
+            cdate = raw_ts.date().isoformat()
+            timestamp = raw_ts.isoformat(timespec="microseconds")
 
         elif cdate is not None and timestamp is None:
             # If cdate is not null, use timestamp associated with midnight
-            raw_ts = datetime.strptime(cdate, "%Y-%m-%d")
-            timestamp = datetime.strftime(raw_ts, "%Y-%m-%dT%H:%M:%S.%f")
+            timestamp = f"{date.fromisoformat(cdate).isoformat()}T00:00:00.000000"
 
         elif cdate is None and timestamp is not None:
             # If timestamp is not null, set cdate equal to date part of timestamp
@@ -444,7 +675,7 @@ class Garmin:
     def get_hydration_data(self, cdate: str) -> Dict[str, Any]:
         """Return available hydration data 'cdate' format 'YYYY-MM-DD'."""
 
-        url = self.get_url(cdate=cdate)
+        url = API_URLS["get_hydration_data"].format(cdate=cdate)
         logger.debug("Requesting hydration data")
 
         return self.connectapi(url)
@@ -460,7 +691,7 @@ class Garmin:
     def get_spo2_data(self, cdate: str) -> Dict[str, Any]:
         """Return available SpO2 data 'cdate' format 'YYYY-MM-DD'."""
 
-        url = self.get_url(cdate=cdate)
+        url = API_URLS["get_spo2_data"].format(cdate=cdate)
         logger.debug("Requesting SpO2 data")
 
         return self.connectapi(url)
@@ -468,7 +699,7 @@ class Garmin:
     def get_all_day_stress(self, cdate: str) -> Dict[str, Any]:
         """Return available all day stress data 'cdate' format 'YYYY-MM-DD'."""
 
-        url = self.get_url(cdate=cdate)
+        url = API_URLS["get_all_day_stress"].format(cdate=cdate)
         logger.debug("Requesting all day stress data")
 
         return self.connectapi(url)
@@ -479,7 +710,7 @@ class Garmin:
         Includes autodetected activities, even if not recorded on the watch
         """
 
-        url = self.get_url(cdate=cdate)
+        url = API_URLS["get_all_day_events"].format(cdate=cdate)
         logger.debug("Requesting all day stress data")
 
         return self.connectapi(url)
@@ -487,7 +718,7 @@ class Garmin:
     def get_personal_record(self) -> Dict[str, Any]:
         """Return personal records for current user."""
 
-        url = self.get_url(display_name=self.display_name)
+        url = self._display_name_urls["get_personal_record"]
         logger.debug("Requesting personal records for user")
 
         return self.connectapi(url)
@@ -495,60 +726,57 @@ class Garmin:
     def get_earned_badges(self) -> Dict[str, Any]:
         """Return earned badges for current user."""
 
-        url = self.get_url()
+        url = API_URLS["get_earned_badges"]
         logger.debug("Requesting earned badges for user")
 
         return self.connectapi(url)
 
+    def _get_paged(self, url_name: str, start, limit):
+        """Fetch one page of the start/limit paged endpoint named 'url_name' in API_URLS."""
+
+        params = {"start": start, "limit": limit}
+
+        return self.connectapi(API_URLS[url_name], params=params)
+
     def get_adhoc_challenges(self, start, limit) -> Dict[str, Any]:
         """Return adhoc challenges for current user."""
 
-        url = self.get_url()
-        params = {"start": str(start), "limit": str(limit)}
         logger.debug("Requesting adhoc challenges for user")
 
-        return self.connectapi(url, params=params)
+        return self._get_paged("get_adhoc_challenges", start, limit)
 
     def get_badge_challenges(self, start, limit) -> Dict[str, Any]:
         """Return badge challenges for current user."""
 
-        url = self.get_url()
-        params = {"start": str(start), "limit": str(limit)}
         logger.debug("Requesting badge challenges for user")
 
-        return self.connectapi(url, params=params)
+        return self._get_paged("get_badge_challenges", start, limit)
 
     def get_available_badge_challenges(self, start, limit) -> Dict[str, Any]:
         """Return available badge challenges."""
 
-        url = self.get_url()
-        params = {"start": str(start), "limit": str(limit)}
         logger.debug("Requesting available badge challenges")
 
-        return self.connectapi(url, params=params)
+        return self._get_paged("get_available_badge_challenges", start, limit)
 
     def get_non_completed_badge_challenges(self, start, limit) -> Dict[str, Any]:
         """Return badge non-completed challenges for current user."""
 
-        url = self.get_url()
-        params = {"start": str(start), "limit": str(limit)}
         logger.debug("Requesting badge challenges for user")
 
-        return self.connectapi(url, params=params)
+        return self._get_paged("get_non_completed_badge_challenges", start, limit)
 
     def get_inprogress_virtual_challenges(self, start, limit) -> Dict[str, Any]:
         """Return in-progress virtual challenges for current user."""
 
-        url = self.get_url()
-        params = {"start": str(start), "limit": str(limit)}
         logger.debug("Requesting in-progress virtual challenges for user")
 
-        return self.connectapi(url, params=params)
+        return self._get_paged("get_inprogress_virtual_challenges", start, limit)
 
     def get_sleep_data(self, cdate: str) -> Dict[str, Any]:
         """Return sleep data for current user."""
-        url = self.get_url(display_name=self.display_name)
-        params = {"date": str(cdate), "nonSleepBufferMinutes": 60}
+        url = self._display_name_urls["get_sleep_data"]
+        params = {"date": cdate, "nonSleepBufferMinutes": 60}
         logger.debug("Requesting sleep data")
 
         return self.connectapi(url, params=params)
@@ -556,7 +784,7 @@ class Garmin:
     def get_stress_data(self, cdate: str) -> Dict[str, Any]:
         """Return stress data for current user."""
 
-        url = self.get_url(cdate=cdate)
+        url = API_URLS["get_stress_data"].format(cdate=cdate)
         logger.debug("Requesting stress data")
 
         return self.connectapi(url)
@@ -564,10 +792,10 @@ class Garmin:
     def get_rhr_day(self, cdate: str) -> Dict[str, Any]:
         """Return resting heartrate data for current user."""
 
-        url = self.get_url(display_name=self.display_name)
+        url = self._display_name_urls["get_rhr_day"]
         params = {
-            "fromDate": str(cdate),
-            "untilDate": str(cdate),
+            "fromDate": cdate,
+            "untilDate": cdate,
             "metricId": 60,
         }
         logger.debug("Requesting resting heartrate data")
@@ -600,15 +828,15 @@ class Garmin:
 
         if end_date is None:
             url = self.garmin_connect_endurance_score_url
-            params = {"calendarDate": str(start_date)}
+            params = {"calendarDate": start_date}
             logger.debug("Requesting endurance score data for a single day")
 
             return self.connectapi(url, params=params)
         else:
             url = f"{self.garmin_connect_endurance_score_url}/stats"
             params = {
-                "startDate": str(start_date),
-                "endDate": str(end_date),
+                "startDate": start_date,
+                "endDate": end_date,
                 "aggregation": "weekly",
             }
             logger.debug("Requesting endurance score data for a range of days")
@@ -635,9 +863,7 @@ class Garmin:
             raise ValueError("results: _type must be one of %r." % valid)
 
         if _type is None and start_date is None and end_date is None:
-            url = (
-                    self.garmin_connect_race_predictor_url + f"/latest/{self.display_name}"
-            )
+            url = self._display_name_urls["get_race_predictions"]
             return self.connectapi(url)
 
         elif _type is not None and start_date is not None and end_date is not None:
@@ -645,8 +871,8 @@ class Garmin:
                     self.garmin_connect_race_predictor_url + f"/{_type}/{self.display_name}"
             )
             params = {
-                "fromCalendarDate": str(start_date),
-                "toCalendarDate": str(end_date),
+                "fromCalendarDate": start_date,
+                "toCalendarDate": end_date,
             }
             return self.connectapi(url, params=params)
 
@@ -664,7 +890,7 @@ class Garmin:
     def get_fitnessage_data(self, cdate: str) -> Dict[str, Any]:
         """Return Fitness Age data for current user."""
 
-        url = self.get_url(cdate=cdate)
+        url = API_URLS["get_fitnessage_data"].format(cdate=cdate)
         logger.debug("Requesting Fitness Age data")
 
         return self.connectapi(url)
@@ -677,7 +903,7 @@ class Garmin:
 
         if end_date is None:
             url = self.garmin_connect_hill_score_url
-            params = {"calendarDate": str(start_date)}
+            params = {"calendarDate": start_date}
             logger.debug("Requesting hill score data for a single day")
 
             return self.connectapi(url, params=params)
@@ -685,8 +911,8 @@ class Garmin:
         else:
             url = f"{self.garmin_connect_hill_score_url}/stats"
             params = {
-                "startDate": str(start_date),
-                "endDate": str(end_date),
+                "startDate": start_date,
+                "endDate": end_date,
                 "aggregation": "daily",
             }
             logger.debug("Requesting hill score data for a range of days")
@@ -696,15 +922,32 @@ class Garmin:
     def get_devices(self) -> List[Dict[str, Any]]:
         """Return available devices for the current user account."""
 
-        url = self.get_url()
+        url = API_URLS["get_devices"]
         logger.debug("Requesting devices")
 
         return self.connectapi(url)
 
+    def _get_devices_cached(self, ttl: float = DEVICES_CACHE_TTL) -> List[Dict[str, Any]]:
+        """Return the devices, reusing a list fetched less than 'ttl' seconds ago."""
+
+        now = time.monotonic()
+        if self._devices_cache is not None and now - self._devices_cache[0] < ttl:
+            return self._devices_cache[1]
+
+        devices = self.get_devices()
+        self._devices_cache = (now, devices)
+
+        return devices
+
+    def invalidate_devices_cache(self):
+        """Forget the cached devices, e.g. after pairing a new device."""
+
+        self._devices_cache = None
+
     def get_device_settings(self, device_id: str) -> Dict[str, Any]:
         """Return device settings for device with 'device_id'."""
 
-        url = self.get_url(device_id=device_id)
+        url = API_URLS["get_device_settings"].format(device_id=device_id)
         logger.debug("Requesting device settings")
 
         return self.connectapi(url)
@@ -714,7 +957,7 @@ class Garmin:
         priority of all devices.
         """
 
-        url = self.get_url()
+        url = API_URLS["get_primary_training_device"]
         logger.debug("Requesting primary training device information")
 
         return self.connectapi(url)
@@ -731,7 +974,7 @@ class Garmin:
 
         params = {"singleDayView": single_day}
 
-        url = self.get_url()
+        url = API_URLS["get_device_solar_data"].format(device_id=device_id, startdate=start_date, enddate=end_date)
         return self.connectapi(url, params=params)["deviceSolarInput"]
 
     def get_device_alarms(self) -> List[Any]:
@@ -739,19 +982,26 @@ class Garmin:
 
         logger.debug("Requesting device alarms")
 
-        alarms = []
-        devices = self.get_devices()
-        for device in devices:
-            device_settings = self.get_device_settings(device["deviceId"])
-            device_alarms = device_settings["alarms"]
-            if device_alarms is not None:
-                alarms += device_alarms
-        return alarms
+        devices = self._get_devices_cached()
+        if not devices:
+            return []
+
+        # Fetch the settings of all devices concurrently
+        with ThreadPoolExecutor(max_workers=min(8, len(devices))) as executor:
+            devices_settings = executor.map(
+                lambda device: self.get_device_settings(device["deviceId"]), devices
+            )
+
+            return [
+                alarm
+                for device_settings in devices_settings
+                for alarm in device_settings.get("alarms") or []
+            ]
 
     def get_device_last_used(self):
         """Return device last used."""
 
-        url = self.get_url()
+        url = API_URLS["get_device_last_used"]
         logger.debug("Requesting device last used")
 
         return self.connectapi(url)
@@ -759,8 +1009,8 @@ class Garmin:
     def get_activities(self, start, limit):
         """Return available activities."""
 
-        url = self.get_url()
-        params = {"start": str(start), "limit": str(limit)}
+        url = API_URLS["get_activities"]
+        params = {"start": start, "limit": limit}
         logger.debug("Requesting activities")
 
         return self.connectapi(url, params=params)
@@ -768,39 +1018,39 @@ class Garmin:
     def get_activities_fordate(self, for_date: str):
         """Return available activities for date."""
 
-        url = self.get_url(for_date=for_date)
+        url = API_URLS["get_activities_fordate"].format(for_date=for_date)
         logger.debug(f"Requesting activities for date {for_date}")
 
         return self.connectapi(url)
 
-    def set_activity_name(self, activity_id, title):
+    def set_activity_name(self, activity_id: Union[int, str], title):
         """Set name for activity with id."""
 
-        url = self.get_url(activity_id=activity_id)
+        url = API_URLS["set_activity_name"].format(activity_id=activity_id)
         payload = {"activityId": activity_id, "activityName": title}
 
+        self.invalidate_response_cache()
         return self.garth.put("connectapi", url, json=payload, api=True)
 
     def change_activity_visibility(
             self, activity_id: Union[int, str], visibility: ACTIVITY_VISIBILITIES
     ):
-        url = self.get_url(activity_id=activity_id)
+        url = API_URLS["change_activity_visibility"].format(activity_id=activity_id)
 
         payload = {
             "accessControlRuleDTO": {"typeKey": visibility},
             "activityId": activity_id,
         }
 
+        self.invalidate_response_cache()
         return self.garth.put("connectapi", url, json=payload, api=True)
 
     def get_last_activity(self):
         """Return last activity."""
 
         activities = self.get_activities(0, 1)
-        if activities:
-            return activities[-1]
 
-        return None
+        return activities[0] if activities else None
 
     def upload_activity(self, activity_path: str):
         """Upload activity in fit format from file."""
@@ -813,22 +1063,61 @@ class Garmin:
         )
 
         if allowed_file_extension:
-            files = {
-                "file": (file_base_name, open(activity_path, "rb" or "r")),
-            }
-            url = self.get_url()
-            return self.garth.post("connectapi", url, files=files, api=True)
+            url = API_URLS["upload_activity"]
+            with open(activity_path, "rb") as f:
+                files = {
+                    "file": (file_base_name, f),
+                }
+                return self.garth.post("connectapi", url, files=files, api=True)
         else:
             raise GarminConnectInvalidFileFormatError(
                 f"Could not upload {activity_path}"
             )
 
-    def delete_activity(self, activity_id):
+    def upload_activities(
+            self,
+            activity_paths: List[str],
+            concurrency: int = 4,
+            rate_per_sec: float = 1.0,
+    ) -> List[Tuple[str, Any]]:
+        """
+        Upload several activity files concurrently, starting at most
+        `rate_per_sec` uploads per second (no limit if it is 0 or less).
+        Returns (path, result) pairs in input order; the result of a failed
+        upload is its exception, so one bad file does not abort the batch.
+        """
+
+        interval = 1 / rate_per_sec if rate_per_sec > 0 else 0
+        lock = threading.Lock()
+        next_start = time.monotonic()
+
+        def upload(activity_path: str) -> Tuple[str, Any]:
+            nonlocal next_start
+
+            with lock:
+                now = time.monotonic()
+                delay = next_start - now
+                next_start = max(now, next_start) + interval
+            if delay > 0:
+                time.sleep(delay)
+
+            logger.debug("Uploading activity %s", activity_path)
+            try:
+                return activity_path, self.upload_activity(activity_path)
+            except Exception as err:
+                logger.warning("Could not upload %s: %s", activity_path, err)
+                return activity_path, err
+
+        with ThreadPoolExecutor(max_workers=min(concurrency, self.garth.pool_maxsize)) as executor:
+            return list(executor.map(upload, activity_paths))
+
+    def delete_activity(self, activity_id: Union[int, str]):
         """Delete activity with specified id"""
 
         url = f"{self.garmin_connect_delete_activity_url}/{activity_id}"
         logger.debug("Deleting activity with id %s", activity_id)
 
+        self.invalidate_response_cache()
         return self.garth.request(
             "DELETE",
             "connectapi",
@@ -836,7 +1125,43 @@ class Garmin:
             api=True,
         )
 
-    def get_activities_by_date(self, start_date, end_date, activity_type=None):
+    def _get_pages_concurrently(
+            self, url: str, params: Dict[str, Any], start: int, limit: int, workers: int = 8
+    ) -> List[Any]:
+        """
+        Fetch consecutive 'limit' sized pages of 'url' from 'start' on until
+        the first short page; return the items of all pages in order. The
+        first page is fetched alone; while pages come back full, the next
+        ones are requested in waves of 2, 4, ... up to 'workers' pages.
+        """
+
+        def get_page(page_start: int) -> List[Any]:
+            return self.connectapi(url, params={**params, "start": page_start, "limit": limit}) or []
+
+        logger.debug("Requesting items %s to %s", start, start + limit - 1)
+        pages = [get_page(start)]
+        if len(pages[0]) < limit:
+            return pages[0]
+        start += limit
+
+        workers = min(workers, self.garth.pool_maxsize)
+        wave = 1
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            while True:
+                wave = min(wave * 2, workers)
+                page_starts = [start + i * limit for i in range(wave)]
+                logger.debug(
+                    "Requesting items %s to %s", start, page_starts[-1] + limit - 1
+                )
+                for page in executor.map(get_page, page_starts):
+                    pages.append(page)
+                    if len(page) < limit:
+                        # Flatten once instead of growing a list page by page
+                        return list(chain.from_iterable(pages))
+
+                start += wave * limit
+
+    def get_activities_by_date(self, start_date, end_date, activity_type=None, limit: Optional[int] = None):
         """
         Fetch available activities between specific dates
         :param start_date: String in the format YYYY-MM-DD
@@ -844,37 +1169,38 @@ class Garmin:
         :param activity_type: (Optional) Type of activity you are searching
                              Possible values are [cycling, running, swimming,
                              multi_sport, fitness_equipment, hiking, walking, other]
+        :param limit: (Optional) Page size. Defaults to DEFAULT_PAGE_LIMIT rather
+                      than the web interface's 20, which takes ~10x fewer
+                      requests; falls back to 20 if Garmin rejects it
         :return: list of JSON activities
         """
 
-        activities = []
         start = 0
-        limit = 20
-        # mimicking the behavior of the web interface that fetches
-        # 20 activities at a time
-        # and automatically loads more on scroll
-        url = self.get_url()
+        url = API_URLS["get_activities_by_date"]
         params = {
-            "startDate": str(start_date),
-            "endDate": str(end_date),
-            "start": str(start),
-            "limit": str(limit),
+            "startDate": start_date,
+            "endDate": end_date,
         }
         if activity_type:
-            params["activityType"] = str(activity_type)
+            params["activityType"] = activity_type
 
         logger.debug(f"Requesting activities by date from {start_date} to {end_date}")
-        while True:
-            params["start"] = str(start)
-            logger.debug(f"Requesting activities {start} to {start + limit}")
-            act = self.connectapi(url, params=params)
-            if act:
-                activities.extend(act)
-                start = start + limit
-            else:
-                break
 
-        return activities
+        if limit is not None:
+            return self._get_pages_concurrently(url, params, start, limit)
+
+        limit = self._PAGE_LIMIT_CAP.get("get_activities_by_date", DEFAULT_PAGE_LIMIT)
+        try:
+            return self._get_pages_concurrently(url, params, start, limit)
+        except GarthHTTPError as e:
+            response = e.error.response
+            if limit <= WEB_PAGE_LIMIT or response is None or response.status_code not in (400, 413):
+                raise
+
+        logger.debug("Page size %s rejected, falling back to %s", limit, WEB_PAGE_LIMIT)
+        self._PAGE_LIMIT_CAP["get_activities_by_date"] = WEB_PAGE_LIMIT
+
+        return self._get_pages_concurrently(url, params, start, WEB_PAGE_LIMIT)
 
     def get_progress_summary_between_dates(
             self, start_date, end_date, metric="distance", group_by_activities=True
@@ -889,22 +1215,22 @@ class Garmin:
         :return: list of JSON activities with their aggregated progress summary
         """
 
-        url = self.get_url()
+        url = API_URLS["get_progress_summary_between_dates"]
         params = {
-            "startDate": str(start_date),
-            "endDate": str(end_date),
+            "startDate": start_date,
+            "endDate": end_date,
             "aggregation": "lifetime",
-            "groupByParentActivityType": str(group_by_activities),
-            "metric": str(metric),
+            "groupByParentActivityType": group_by_activities,
+            "metric": metric,
         }
 
         logger.debug(f"Requesting fitness-stats by date from {start_date} to {end_date}")
         return self.connectapi(url, params=params)
 
     def get_activity_types(self):
-        url = self.get_url()
+        url = API_URLS["get_activity_types"]
         logger.debug("Requesting activity types")
-        return self.connectapi(url)
+        return self._cached_connectapi(url, ACTIVITY_TYPES_CACHE_TTL)
 
     def get_goals(self, status="active", start=1, limit=30):
         """
@@ -918,34 +1244,22 @@ class Garmin:
         :return: list of goals in JSON format
         """
 
-        goals = []
         url = self.garmin_connect_goals_url
         params = {
             "status": status,
-            "start": str(start),
-            "limit": str(limit),
             "sortOrder": "asc",
         }
 
         logger.debug(f"Requesting {status} goals")
-        while True:
-            params["start"] = str(start)
-            logger.debug(f"Requesting {status} goals {start} to {start + limit - 1}")
-            goals_json = self.connectapi(url, params=params)
-            if goals_json:
-                goals.extend(goals_json)
-                start = start + limit
-            else:
-                break
-
-        return goals
+
+        return self._get_pages_concurrently(url, params, start, limit)
 
     def get_gear(self, userProfileNumber):
         """Return all user gear."""
         url = f"{self.garmin_connect_gear}?userProfilePk={userProfileNumber}"
         logger.debug("Requesting gear for user %s", userProfileNumber)
 
-        return self.connectapi(url)
+        return self._cached_connectapi(url, PROFILE_CACHE_TTL)
 
     def get_gear_stats(self, gearUUID):
         url = f"{self.garmin_connect_gear_baseurl}stats/{gearUUID}"
@@ -958,7 +1272,7 @@ class Garmin:
             f"{userProfileNumber}/activityTypes"
         )
         logger.debug("Requesting gear for user %s", userProfileNumber)
-        return self.connectapi(url)
+        return self._cached_connectapi(url, PROFILE_CACHE_TTL)
 
     def set_gear_default(self, activityType, gearUUID, defaultGear=True):
         defaultGearString = "/default/true" if defaultGear else ""
@@ -967,6 +1281,7 @@ class Garmin:
             f"{self.garmin_connect_gear_baseurl}{gearUUID}/"
             f"activityType/{activityType}{defaultGearString}"
         )
+        self.invalidate_response_cache()
         return self.garth.request(method_override, "connectapi", url, api=True)
 
     class ActivityDownloadFormat(Enum):
@@ -983,105 +1298,168 @@ class Garmin:
         GPX = auto()
         TCX = auto()
 
-    def download_activity(self, activity_id, dl_fmt=ActivityDownloadFormat.TCX):
+    # download_activity() URL of each format, formatted with the activity id
+    _DL_URL_TEMPLATES = {
+        ActivityDownloadFormat.ORIGINAL: garmin_connect_fit_download + "/{activity_id}",
+        ActivityDownloadFormat.TCX: garmin_connect_tcx_download + "/{activity_id}",
+        ActivityDownloadFormat.GPX: garmin_connect_gpx_download + "/{activity_id}",
+        ActivityDownloadFormat.KML: garmin_connect_kml_download + "/{activity_id}",
+        ActivityDownloadFormat.CSV: garmin_connect_csv_download + "/{activity_id}",
+    }
+
+    def download_activity(self, activity_id: Union[int, str], dl_fmt=ActivityDownloadFormat.TCX, fileobj=None):
         """
         Downloads activity in requested format and returns the raw bytes. For
         "Original" will return the zip file content, up to user to extract it.
         "CSV" will return a csv of the splits.
+        If a binary file-like 'fileobj' is given, the download is streamed
+        into it chunk by chunk and None is returned.
         """
-        activity_id = str(activity_id)
-        urls = {
-            Garmin.ActivityDownloadFormat.ORIGINAL: f"{self.garmin_connect_fit_download}/{activity_id}",  # noqa
-            Garmin.ActivityDownloadFormat.TCX: f"{self.garmin_connect_tcx_download}/{activity_id}",  # noqa
-            Garmin.ActivityDownloadFormat.GPX: f"{self.garmin_connect_gpx_download}/{activity_id}",  # noqa
-            Garmin.ActivityDownloadFormat.KML: f"{self.garmin_connect_kml_download}/{activity_id}",  # noqa
-            Garmin.ActivityDownloadFormat.CSV: f"{self.garmin_connect_csv_download}/{activity_id}",  # noqa
-        }
-        if dl_fmt not in urls:
+        url_template = self._DL_URL_TEMPLATES.get(dl_fmt)
+        if url_template is None:
             raise ValueError(f"Unexpected value {dl_fmt} for dl_fmt")
-        url = urls[dl_fmt]
+        url = url_template.format(activity_id=activity_id)
 
         logger.debug("Downloading activities from %s", url)
 
-        return self.download(url)
+        # The original export is already a zip file; compressing it again for
+        # transfer would only cost CPU on both ends
+        headers = {"Accept-Encoding": "identity"} if dl_fmt == self.ActivityDownloadFormat.ORIGINAL else {}
 
-    def get_activity_splits(self, activity_id):
-        """Return activity splits."""
+        if fileobj is not None:
+            return self.download_to(url, fileobj, headers=headers)
 
-        activity_id = str(activity_id)
-        url = self.get_url(activity_id=activity_id)
-        logger.debug("Requesting splits for activity id %s", activity_id)
+        return self.download(url, headers=headers)
 
-        return self.connectapi(url)
+    def _get_activity_subresource(
+            self, url_name: str, activity_id: Union[int, str], description: str, ttl: Optional[float] = None
+    ):
+        """
+        Fetch the API_URLS["url_name"] resource of an activity; with 'ttl',
+        through the response cache. 'activity_id' may be an int or a str;
+        it is only stringified once, by str.format.
+        """
+
+        url = API_URLS[url_name].format(activity_id=activity_id)
+        logger.debug("Requesting %s for activity id %s", description, activity_id)
+
+        if ttl is None:
+            return self.connectapi(url)
+
+        return self._cached_connectapi(url, ttl)
+
+    def get_activity_splits(self, activity_id: Union[int, str]):
+        """Return activity splits."""
 
-    def get_activity_typed_splits(self, activity_id):
+        return self._get_activity_subresource("get_activity_splits", activity_id, "splits", ttl=ACTIVITY_CACHE_TTL)
+
+    def get_activity_typed_splits(self, activity_id: Union[int, str]):
         """Return typed activity splits. Contains similar info to `get_activity_splits`, but for certain activity types
         (e.g., Bouldering), this contains more detail."""
 
-        url = self.get_url(activity_id=str(activity_id))
-        logger.debug("Requesting typed splits for activity id %s", activity_id)
-
-        return self.connectapi(url)
+        return self._get_activity_subresource("get_activity_typed_splits", activity_id, "typed splits")
 
-    def get_activity_split_summaries(self, activity_id):
+    def get_activity_split_summaries(self, activity_id: Union[int, str]):
         """Return activity split summaries."""
 
-        url = self.get_url(activity_id=str(activity_id))
-        logger.debug("Requesting split summaries for activity id %s", activity_id)
-
-        return self.connectapi(url)
+        return self._get_activity_subresource("get_activity_split_summaries", activity_id, "split summaries")
 
-    def get_activity_weather(self, activity_id):
+    def get_activity_weather(self, activity_id: Union[int, str]):
         """Return activity weather."""
 
-        url = self.get_url(activity_id=str(activity_id))
-        logger.debug(f"Requesting weather for {activity_id=}")
+        return self._get_activity_subresource("get_activity_weather", activity_id, "weather", ttl=ACTIVITY_CACHE_TTL)
 
-        return self.connectapi(url)
-
-    def get_activity_hr_in_timezones(self, activity_id):
+    def get_activity_hr_in_timezones(self, activity_id: Union[int, str]):
         """Return activity heartrate in timezones."""
 
-        url = self.get_url(activity_id=str(activity_id))
-        logger.debug("Requesting split summaries for activity id %s", activity_id)
+        return self._get_activity_subresource("get_activity_hr_in_timezones", activity_id, "heart rate time in zones")
 
-        return self.connectapi(url)
-
-    def get_activity(self, activity_id):
+    def get_activity(self, activity_id: Union[int, str]):
         """Return activity summary, including basic splits."""
 
-        url = self.get_url(activity_id=str(activity_id))
-        logger.debug("Requesting activity summary data for activity id %s", activity_id)
-
-        return self.connectapi(url)
+        return self._get_activity_subresource("get_activity", activity_id, "summary data", ttl=ACTIVITY_CACHE_TTL)
 
-    def get_activity_details(self, activity_id, maxchart=2000, maxpoly=4000):
-        """Return activity details."""
+    def get_activity_details(
+            self, activity_id: Union[int, str], maxchart=2000, maxpoly=4000, fields: Optional[Tuple[str, ...]] = None
+    ):
+        """
+        Return activity details. If 'fields' is given, e.g.
+        ("metricDescriptors", "activityDetailMetrics"), only those top-level
+        keys are returned.
+        """
 
-        activity_id = str(activity_id)
         params = {
-            "maxChartSize": str(maxchart),
-            "maxPolylineSize": str(maxpoly),
+            "maxChartSize": maxchart,
+            "maxPolylineSize": maxpoly,
         }
-        url = self.get_url(activity_id=activity_id)
+        url = API_URLS["get_activity_details"].format(activity_id=activity_id)
         logger.debug(f"Requesting details for {activity_id=}")
 
-        return self.connectapi(url, params=params)
+        details = self._cached_connectapi(url, ACTIVITY_CACHE_TTL, params=params)
+        if fields is None or not details:
+            return details
+
+        return {field: details[field] for field in fields if field in details}
+
+    # get_activities_bulk() fetcher names and the methods they call
+    _ACTIVITY_FETCHERS = {
+        "summary": "get_activity",
+        "splits": "get_activity_splits",
+        "typed_splits": "get_activity_typed_splits",
+        "split_summaries": "get_activity_split_summaries",
+        "weather": "get_activity_weather",
+        "hr_in_timezones": "get_activity_hr_in_timezones",
+        "details": "get_activity_details",
+        "exercise_sets": "get_activity_exercise_sets",
+        "gear": "get_activity_gear",
+    }
+
+    def get_activities_bulk(
+            self,
+            activity_ids: List[Union[int, str]],
+            fetchers: Tuple[str, ...] = ("summary", "splits", "weather"),
+            workers: int = 16,
+    ) -> Dict[Union[int, str], Dict[str, Any]]:
+        """
+        Fetch the given per-activity 'fetchers' (keys of _ACTIVITY_FETCHERS)
+        for every id in 'activity_ids' concurrently and return
+        {activity_id: {fetcher: json}}.
+        """
 
-    def get_activity_exercise_sets(self, activity_id):
-        """Return activity exercise sets."""
+        unknown = set(fetchers) - self._ACTIVITY_FETCHERS.keys()
+        if unknown:
+            raise ValueError(f"Unexpected fetchers {sorted(unknown)}")
 
-        url = self.get_url(activity_id=str(activity_id))
-        logger.debug(f"Requesting exercise sets for {activity_id}")
+        work = [(activity_id, fetcher) for activity_id in activity_ids for fetcher in fetchers]
+        if not work:
+            return {}
 
-        return self.connectapi(url)
+        # More threads than pooled connections would only open and discard
+        # extra TLS connections
+        workers = min(workers, self.garth.pool_maxsize, len(work))
+        logger.debug("Requesting %s for %s activities", fetchers, len(activity_ids))
 
-    def get_activity_gear(self, activity_id):
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(
+                lambda item: getattr(self, self._ACTIVITY_FETCHERS[item[1]])(item[0]), work
+            )
+
+            activities: Dict[Union[int, str], Dict[str, Any]] = {}
+            for (activity_id, fetcher), result in zip(work, results):
+                activities.setdefault(activity_id, {})[fetcher] = result
+
+        return activities
+
+    def get_activity_exercise_sets(self, activity_id: Union[int, str]):
+        """Return activity exercise sets."""
+
+        return self._get_activity_subresource("get_activity_exercise_sets", activity_id, "exercise sets")
+
+    def get_activity_gear(self, activity_id: Union[int, str]):
         """Return gears used for activity id."""
 
-        activity_id = str(activity_id)
         params = {
-            "activityId": str(activity_id),
+            "activityId": activity_id,
         }
         url = self.garmin_connect_gear
         logger.debug("Requesting gear for activity_id %s", activity_id)
@@ -1091,7 +1469,7 @@ class Garmin:
     def get_gear_activities(self, gear_uuid):
         """Return activities where gear uuid was used."""
 
-        url = self.get_url(gear_uuid=str(gear_uuid))
+        url = API_URLS["get_gear_activities"].format(gear_uuid=gear_uuid)
         logger.debug(f"Requesting activities for {gear_uuid=}")
 
         return self.connectapi(url)
@@ -1099,10 +1477,10 @@ class Garmin:
     def get_user_profile(self):
         """Get all users settings."""
 
-        url = self.get_url()
+        url = API_URLS["get_user_profile"]
         logger.debug("Requesting user profile.")
 
-        return self.connectapi(url)
+        return self._cached_connectapi(url, PROFILE_CACHE_TTL)
 
     def request_reload(self, cdate: str):
         """
@@ -1147,7 +1525,7 @@ class Garmin:
     def get_menstrual_data_for_date(self, for_date: str):
         """Return menstrual data for date."""
 
-        url = self.get_url(for_date=for_date)
+        url = API_URLS["get_menstrual_data_for_date"].format(for_date=for_date)
         logger.debug(f"Requesting menstrual data for date: {for_date}")
 
         return self.connectapi(url)
@@ -1155,7 +1533,7 @@ class Garmin:
     def get_menstrual_calendar_data(self, start_date: str, end_date: str):
         """Return summaries of cycles that have days between start_date and end_date."""
 
-        url = self.get_url(start_date=start_date, end_date=end_date)
+        url = API_URLS["get_menstrual_calendar_data"].format(start_date=start_date, end_date=end_date)
         logger.debug(
             f"Requesting menstrual data for dates {start_date} through {end_date}"
         )
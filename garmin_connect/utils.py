@@ -1,10 +1,17 @@
-import inspect
-from typing import Literal
+import json
+import sys
+from typing import Any, Literal, Union
 
-__all__ = ["get_mfa", "get_caller_name"]
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+__all__ = ["get_mfa", "get_caller_name", "json_loads", "json_dumps"]
 
 CALLER_NAME_FORMATS = Literal["module", "class", "method"]
 
+
 def get_mfa():
     """Get MFA."""
     return input("MFA one-time code: ")
@@ -18,17 +25,16 @@ def get_caller_name(return_format: CALLER_NAME_FORMATS = "method", skip: int = 2
 
     An empty string is returned if skipped levels exceed stack height
     """
-    stack = inspect.stack()
-    start = 0 + skip
-    if len(stack) < start + 1:
+    try:
+        parentframe = sys._getframe(skip)
+    except ValueError:
         return ""
-    parentframe = stack[start][0]
 
     name = []
-    module = inspect.getmodule(parentframe)
+    module_name = parentframe.f_globals.get("__name__")
 
-    if return_format == "module" and module:
-        name.append(module.__name__)
+    if return_format == "module" and module_name:
+        name.append(module_name)
 
     if (return_format in ("module", "class")) and "self" in parentframe.f_locals:
         name.append(parentframe.f_locals["self"].__class__.__name__)
@@ -37,6 +43,22 @@ def get_caller_name(return_format: CALLER_NAME_FORMATS = "method", skip: int = 2
     if codename != "<module>":  # top level usually
         name.append(codename)  # function or a method
 
-    del parentframe, stack
+    del parentframe
 
     return ".".join(name)
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """Deserialize JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+
+    return json.loads(data)
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Serialize `obj` to compact UTF-8 encoded JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
@@ -0,0 +1,11 @@
+import pytest
+
+from garmin_connect import service
+
+
+@pytest.fixture(autouse=True)
+def clear_http_clients():
+    """Keep the per-account HTTP clients from leaking between tests."""
+    service._http_clients.clear()
+    yield
+    service._http_clients.clear()
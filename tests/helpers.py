@@ -0,0 +1,51 @@
+import time
+from types import SimpleNamespace
+from typing import Dict, Optional
+
+import requests
+from garth.auth_tokens import OAuth1Token, OAuth2Token
+
+from garmin_connect.repository import InMemoryOAuthRepository
+from garmin_connect.service import Garmin
+
+
+def make_oauth1_token() -> OAuth1Token:
+    return OAuth1Token(oauth_token="token", oauth_token_secret="secret")
+
+
+def make_oauth2_token(expires_at: Optional[int] = None) -> OAuth2Token:
+    if expires_at is None:
+        expires_at = int(time.time()) + 3600
+
+    return OAuth2Token(
+        scope="",
+        jti="",
+        token_type="Bearer",
+        access_token="access",
+        refresh_token="refresh",
+        expires_in=3600,
+        expires_at=expires_at,
+        refresh_token_expires_in=3600,
+        refresh_token_expires_at=int(time.time()) + 3600,
+    )
+
+
+def make_response(
+    status_code: int = 200, content: bytes = b"{}", headers: Optional[Dict[str, str]] = None
+) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content
+    response.headers.update(headers or {})
+    response.url = "https://connectapi.garmin.com/"
+
+    return response
+
+
+def make_garmin(email: str = "user@example.com") -> Garmin:
+    """A Garmin instance with valid in-memory tokens; stub garmin.garth.sess.request."""
+    repository = InMemoryOAuthRepository(make_oauth1_token(), make_oauth2_token())
+    garmin = Garmin(repository, SimpleNamespace(email=email, password="password"))
+    garmin.garth.loads()
+
+    return garmin
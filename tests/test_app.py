@@ -0,0 +1,85 @@
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+import requests
+from garth.exc import GarthHTTPError
+
+from garmin_connect import app
+from garmin_connect.repository import FileOAuthRepository
+from garmin_connect.service import Garmin
+from tests.helpers import make_oauth1_token, make_oauth2_token
+
+
+def rejected():
+    return GarthHTTPError(msg="Error in request", error=requests.HTTPError("401 Unauthorized"))
+
+
+@pytest.fixture
+def tokenstore(tmp_path):
+    configuration = SimpleNamespace(email="user@example.com", password="password", tokenstore=str(tmp_path))
+    with mock.patch.object(app, "get_garmin_connect_configuration", return_value=configuration):
+        yield tmp_path
+
+
+def stub_login(token_login=None):
+    """
+    Replace Garmin.login: credential logins succeed and set fresh tokens,
+    token logins call 'token_login' (if given) and otherwise succeed.
+    """
+    calls = []
+
+    def login(self, use_creds=False):
+        calls.append(use_creds)
+        if use_creds:
+            self.garth.oauth1_token, self.garth.oauth2_token = make_oauth1_token(), make_oauth2_token()
+        elif token_login is not None:
+            token_login(self)
+
+    return mock.patch.object(Garmin, "login", login), calls
+
+
+def test_login_with_stored_tokens(tokenstore):
+    FileOAuthRepository(str(tokenstore)).set_oauth(make_oauth1_token(), make_oauth2_token())
+    patch, calls = stub_login()
+
+    with patch:
+        assert app._login() is not None
+
+    assert calls == [False]
+
+
+def test_login_with_credentials_stores_tokens(tokenstore):
+    def token_login(garmin):
+        raise FileNotFoundError("tokens.json")
+
+    patch, calls = stub_login(token_login)
+
+    with patch:
+        assert app._login() is not None
+
+    assert calls == [False, True]
+    assert FileOAuthRepository(str(tokenstore)).get_oauth()
+
+
+def test_login_falls_back_to_credentials_when_refreshed_tokens_are_rejected(tokenstore):
+    def token_login(garmin):
+        # Another worker stores new tokens while this one fails, but they
+        # are rejected as well
+        FileOAuthRepository(str(tokenstore)).set_oauth(make_oauth1_token(), make_oauth2_token())
+        raise rejected()
+
+    patch, calls = stub_login(token_login)
+
+    with patch:
+        assert app._login() is not None
+
+    assert calls == [False, False, True]
+
+
+def test_login_returns_none_when_credentials_are_rejected(tokenstore):
+    def login(self, use_creds=False):
+        raise rejected()
+
+    with mock.patch.object(Garmin, "login", login):
+        assert app._login() is None
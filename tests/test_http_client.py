@@ -0,0 +1,62 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from garmin_connect.http_client import GarminConnectHTTPClient
+from garmin_connect.repository import InMemoryOAuthRepository
+from tests.helpers import make_oauth1_token, make_oauth2_token, make_response
+
+
+def make_client() -> GarminConnectHTTPClient:
+    client = GarminConnectHTTPClient(
+        repository=InMemoryOAuthRepository(make_oauth1_token(), make_oauth2_token())
+    )
+    client.loads()
+
+    return client
+
+
+def test_loads_tokens_from_repository():
+    oauth1, oauth2 = make_oauth1_token(), make_oauth2_token()
+    client = GarminConnectHTTPClient(repository=InMemoryOAuthRepository(oauth1, oauth2))
+
+    client.loads()
+
+    assert client.oauth1_token == oauth1
+    assert client.oauth2_token == oauth2
+
+
+def test_dumps_tokens_to_repository():
+    repository = InMemoryOAuthRepository()
+    client = GarminConnectHTTPClient(repository=repository)
+    client.oauth1_token, client.oauth2_token = make_oauth1_token(), make_oauth2_token()
+
+    client.dumps()
+
+    assert repository.get_oauth() == (client.oauth1_token, client.oauth2_token)
+
+
+def test_loads_keeps_pooled_connections():
+    client = make_client()
+    adapter = client.sess.get_adapter("https://connectapi.garmin.com")
+
+    client.loads()
+
+    # Remounting the adapter would drop the keep-alive connections
+    assert client.sess.get_adapter("https://connectapi.garmin.com") is adapter
+
+
+def test_expired_token_is_refreshed_once_by_concurrent_requests():
+    client = make_client()
+    client.oauth2_token = make_oauth2_token(expires_at=0)
+    client.sess.request = mock.Mock(return_value=make_response())
+
+    def exchange(oauth1_token, client):
+        time.sleep(0.05)
+        return make_oauth2_token()
+
+    with mock.patch("garth.sso.exchange", side_effect=exchange) as mock_exchange:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda _: client.connectapi("/resource"), range(16)))
+
+    assert mock_exchange.call_count == 1
@@ -0,0 +1,93 @@
+import json
+from pathlib import Path
+from unittest import mock
+
+import pytest
+from garth.utils import asdict
+
+from garmin_connect.exceptions import GarminConnectAuthenticationError
+from garmin_connect.repository import FileOAuthRepository, InMemoryOAuthRepository
+from tests.helpers import make_oauth1_token, make_oauth2_token
+
+
+def test_in_memory_repository_round_trip():
+    oauth1, oauth2 = make_oauth1_token(), make_oauth2_token()
+    repository = InMemoryOAuthRepository()
+
+    repository.set_oauth(oauth1, oauth2)
+
+    assert repository.get_oauth() == (oauth1, oauth2)
+
+
+def test_in_memory_repository_without_tokens():
+    with pytest.raises(GarminConnectAuthenticationError):
+        InMemoryOAuthRepository().get_oauth()
+
+
+def test_file_repository_round_trip(tmp_path):
+    oauth1, oauth2 = make_oauth1_token(), make_oauth2_token()
+
+    FileOAuthRepository(str(tmp_path)).set_oauth(oauth1, oauth2)
+
+    assert json.loads((tmp_path / "tokens.json").read_text()).keys() == {"oauth1", "oauth2"}
+    assert FileOAuthRepository(str(tmp_path)).get_oauth() == (oauth1, oauth2)
+
+
+def test_file_repository_keeps_token_not_being_replaced(tmp_path):
+    repository = FileOAuthRepository(str(tmp_path))
+    oauth1, oauth2 = make_oauth1_token(), make_oauth2_token()
+    repository.set_oauth(oauth1, oauth2)
+
+    new_oauth2 = make_oauth2_token(expires_at=oauth2.expires_at + 60)
+    repository.set_oauth(None, new_oauth2)
+
+    assert FileOAuthRepository(str(tmp_path)).get_oauth() == (oauth1, new_oauth2)
+
+
+def test_file_repository_falls_back_to_legacy_files(tmp_path):
+    oauth1, oauth2 = make_oauth1_token(), make_oauth2_token()
+    (tmp_path / "oauth1_token.json").write_text(json.dumps(asdict(oauth1)))
+    (tmp_path / "oauth2_token.json").write_text(json.dumps(asdict(oauth2)))
+
+    assert FileOAuthRepository(str(tmp_path)).get_oauth() == (oauth1, oauth2)
+
+
+def test_file_repository_without_tokens(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        FileOAuthRepository(str(tmp_path)).get_oauth()
+
+
+def test_file_repository_reuses_parsed_tokens(tmp_path):
+    repository = FileOAuthRepository(str(tmp_path))
+    repository.set_oauth(make_oauth1_token(), make_oauth2_token())
+    FileOAuthRepository(str(tmp_path)).get_oauth()
+
+    with mock.patch("pathlib.Path.read_bytes", autospec=True, side_effect=Path.read_bytes) as read_bytes:
+        repository = FileOAuthRepository(str(tmp_path))
+        assert repository.get_oauth() is repository.get_oauth()
+
+    assert read_bytes.call_count == 1
+
+
+def test_file_repository_rereads_file_changed_by_another_process(tmp_path):
+    repository = FileOAuthRepository(str(tmp_path))
+    repository.set_oauth(make_oauth1_token(), make_oauth2_token())
+    assert repository.get_oauth()
+
+    new_oauth2 = make_oauth2_token(expires_at=1)
+    FileOAuthRepository(str(tmp_path)).set_oauth(make_oauth1_token(), new_oauth2)
+
+    assert repository.get_oauth()[1] == new_oauth2
+
+
+def test_file_repository_write_is_atomic(tmp_path):
+    oauth1, oauth2 = make_oauth1_token(), make_oauth2_token()
+    FileOAuthRepository(str(tmp_path)).set_oauth(oauth1, oauth2)
+    assert not (tmp_path / "tokens.json.tmp").exists()
+
+    with mock.patch("os.replace", side_effect=OSError("disk full")):
+        with pytest.raises(OSError):
+            FileOAuthRepository(str(tmp_path)).set_oauth(oauth1, make_oauth2_token(expires_at=1))
+
+    # A failed write never leaves a partial tokens.json behind
+    assert FileOAuthRepository(str(tmp_path)).get_oauth() == (oauth1, oauth2)